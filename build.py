@@ -0,0 +1,29 @@
+"""
+Compiles epublib.reader in place with mypyc when building on CPython, the
+resulting extension modules are picked up by poetry when packaging the
+wheel. Other interpreters (e.g. PyPy) get the pure Python module.
+"""
+
+import platform
+
+
+def build() -> None:
+    if platform.python_implementation() != "CPython":
+        return
+
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        return
+
+    from setuptools import setup
+
+    setup(
+        name="epublib",
+        ext_modules=mypycify(["epublib/reader.py"]),
+        script_args=["build_ext", "--inplace"],
+    )
+
+
+if __name__ == "__main__":
+    build()
@@ -1,14 +1,59 @@
-import os
-import pathlib
-import html2text
+import html
+import io
+import pickle
+import re
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import closing, suppress
+from functools import lru_cache
 from lxml import etree
-from typing import Any, IO, Dict, List, Optional
+from queue import Empty, Queue
+from typing import (
+    Any,
+    IO,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    SupportsIndex,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from mypy_extensions import mypyc_attr
 from stream_unzip import stream_unzip
 from dataclasses import dataclass
 
-xml_parser_singleton: etree.XMLParser = etree.XMLParser(
-    recover=True, resolve_entities=True
-)
+T = TypeVar("T")
+
+# lxml parsers are not thread-safe, each thread lazily builds its own.
+_parser_local = threading.local()
+
+
+def get_xml_parser() -> etree.XMLParser:
+    parser: Optional[etree.XMLParser] = getattr(_parser_local, "parser", None)
+    if parser is None:
+        # Container, OPF and NCX files don't need entities, ids nor network
+        # access, so we spare lxml the work.
+        parser = etree.XMLParser(
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+            collect_ids=False,
+            huge_tree=False,
+            remove_blank_text=True,
+        )
+        _parser_local.parser = parser
+
+    return parser
+
 
 NAMESPACES = {
     "XML": "http://www.w3.org/XML/1998/namespace",
@@ -19,38 +64,225 @@ NAMESPACES = {
     "DC": "http://purl.org/dc/elements/1.1/",
     "XHTML": "http://www.w3.org/1999/xhtml",
 }
-CONTENT_FILETYPES = {".xhtml", ".xml", ".opf"}
+CONTENT_FILETYPES = frozenset({".xhtml", ".xml", ".opf"})
+CONTAINER_PATH = "META-INF/container.xml"
+# Minimum amount of xhtml documents for text conversion to be handed over to
+# an executor, dispatching a handful of documents costs more than converting
+# them.
+PARALLEL_THRESHOLD = 32
+# Block size and amount of blocks read ahead by `read_async`.
+PREFETCH_CHUNK_SIZE = 1 << 20
+PREFETCH_DEPTH = 4
+
+OPF_MANIFEST = "{%s}manifest" % NAMESPACES["OPF"]
+OPF_ITEM = "{%s}item" % NAMESPACES["OPF"]
+XHTML_MEDIATYPE = "application/xhtml+xml"
+# Regex based text extraction, see `strip_html_tags`.
+# Tags whose boundaries break lines in the extracted text.
+BLOCK_TAGS = ("p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "br")
+# Tag contents, quoted attribute values may hold '>' in well formed markup.
+TAG_CONTENTS = rb"(?:[^>\"']|\"[^\"]*\"|'[^']*')*"
+BLOCK_TAG_RE = re.compile(
+    rb"</?(?:%s)\b%s>" % ("|".join(BLOCK_TAGS).encode("ascii"), TAG_CONTENTS), re.I
+)
+TAG_RE = re.compile(rb"<%s>" % TAG_CONTENTS)
+# Self-closing opening tags have no block to skip, TAG_RE drops them.
+SKIPPED_BLOCKS_RE = re.compile(
+    rb"<!--.*?-->|<(script|style|head)\b%s(?<!/)>.*?</\1\s*>" % TAG_CONTENTS,
+    re.S | re.I,
+)
+# Protobuf wire format, see `Epub.to_protobuf`.
+PROTOBUF_VARINT = 0
+PROTOBUF_FIXED64 = 1
+PROTOBUF_LENGTH_DELIMITED = 2
+PROTOBUF_FIXED32 = 5
+PROTOBUF_TEXTS_FIELD = 1
+# Field number 1 with the length-delimited wire type.
+PROTOBUF_TEXTS_KEY = b"\x0a"
+ROOTFILE_XPATH = etree.XPath(
+    ".//c:rootfile[@media-type='application/oebps-package+xml']",
+    namespaces={"c": NAMESPACES["CONTAINERS"]},
+)
 
 
+# Public classes stay subclassable when compiled with mypyc.
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Epub:
     def __init__(self, texts: List[str]):
         self.texts = texts
 
     def dump_contents(self) -> str:
-        epub_text = ""
-        for text in self.texts:
-            epub_text += text
+        return "".join(self.texts)
+
+    def write_to(self, fp: IO[str]) -> None:
+        """
+        Streams every text into `fp` without building the whole contents
+        in memory first.
+        """
+        fp.writelines(self.texts)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        # Spelled out instead of deferring to object.__reduce_ex__, which
+        # can't rebuild mypyc compiled instances.
+        if int(protocol) < 5:
+            return (type(self), (self.texts,))
+
+        # Texts are handed over as raw UTF-8 buffers, which pickle can move
+        # out-of-band when given a `buffer_callback`.
+        buffers = [pickle.PickleBuffer(text.encode("utf-8")) for text in self.texts]
+        return (restore_epub, (type(self), *buffers))
+
+    def to_protobuf(self, path: str) -> None:
+        """
+        Serializes the texts following the `message Epub { repeated string
+        texts = 1; }` protobuf schema.
+        """
+        with open(path, "wb") as fp:
+            for text in self.texts:
+                encoded_text = text.encode("utf-8")
+                fp.write(PROTOBUF_TEXTS_KEY)
+                fp.write(encode_varint(len(encoded_text)))
+                fp.write(encoded_text)
+
+    @classmethod
+    def from_protobuf(cls, path: str) -> "Epub":
+        """
+        Reads texts serialized by `to_protobuf`. As protobuf readers are
+        expected to, unknown fields are skipped.
+        """
+        with open(path, "rb") as fp:
+            data = fp.read()
+
+        texts: List[str] = []
+        position = 0
+        while position < len(data):
+            key, position = decode_varint(data, position)
+            field_number, wire_type = key >> 3, key & 0x07
+
+            if wire_type == PROTOBUF_VARINT:
+                _, position = decode_varint(data, position)
+            elif wire_type == PROTOBUF_FIXED64:
+                position += 8
+            elif wire_type == PROTOBUF_FIXED32:
+                position += 4
+            elif wire_type == PROTOBUF_LENGTH_DELIMITED:
+                length, start = decode_varint(data, position)
+                position = start + length
+                if field_number == PROTOBUF_TEXTS_FIELD:
+                    texts.append(data[start:position].decode("utf-8"))
+            else:
+                # Groups are deprecated and never written by protobuf 3.
+                raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+
+            if position > len(data):
+                raise ValueError("Truncated protobuf field")
+
+        return cls(texts=texts)
+
+
+def restore_epub(cls: Type[Epub], *buffers: Any) -> Epub:
+    return cls(texts=[str(buffer, "utf-8") for buffer in buffers])
+
+
+def encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+def decode_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    Returns the decoded value along with the position right after it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated protobuf varint")
 
-        return epub_text
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, position
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MalformedEpubException(Exception):
     pass
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 @dataclass
 class UncompressedEpub:
     rootfiles: List[str]
-    files: Dict[str, bytearray]
+    files: Mapping[str, bytes]
+
+
+class ArchivedFiles(Mapping[str, bytes]):
+    """
+    Read-only view over the members of a zip archive, anchored to the OCF
+    root directory. Members are only decompressed when looked up.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, root: str):
+        self.archive = archive
+        self.root = root
+
+    def __getitem__(self, path: str) -> bytes:
+        # zipfile raises KeyError on its own for missing members.
+        return self.archive.read(self.root + path)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.archive.namelist():
+            if name.startswith(self.root):
+                yield name[len(self.root) :]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class ArenaFiles(Mapping[str, bytes]):
+    """
+    Files laid out back to back in a single buffer, indexed by their offset
+    and length. Contents are only copied out of the arena when looked up.
+    """
+
+    def __init__(self) -> None:
+        self.arena = bytearray()
+        self.index: Dict[str, Tuple[int, int]] = dict()
+
+    def append(self, path: str, file_chunks: Iterable[bytes]) -> None:
+        start = len(self.arena)
+        for chunk in file_chunks:
+            self.arena += chunk
+
+        # Empty files are indexed too, they are still part of the archive.
+        self.index[path] = (start, len(self.arena) - start)
 
+    def __getitem__(self, path: str) -> bytes:
+        start, length = self.index[path]
+        # lxml only parses bytes, slicing through a view spares us a copy.
+        with memoryview(self.arena) as view:
+            return bytes(view[start : start + length])
 
-def decode(data: bytearray, encoding: str = "utf-8") -> str:
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+def decode(data: bytes, encoding: str = "utf-8") -> str:
     return data.decode(encoding)
 
 
-def normalize_path(
-    rootfiles: List[str], files: Dict[str, bytearray]
-) -> Dict[str, bytearray]:
+def normalize_path(rootfiles: List[str], files: Dict[str, T]) -> Dict[str, T]:
     # We keep track of filepaths anchored to our uncompressed root directory,
     # which might be different than our epub root directory.
     # The rootpath obtained from container.xml is relative to the epub
@@ -83,106 +315,225 @@ def normalize_path(
     if rootfiles[0] in files:
         return files
 
-    normalized_dict: Dict[str, bytearray] = dict()
+    normalized_dict: Dict[str, T] = dict()
+
+    # The caller hands `files` over to us, so we drain it as we go instead of
+    # keeping two full maps alive at the same time.
+    while files:
+        path, contents = files.popitem()
 
-    for path in files:
         # Epubs follow the OpenContainerFormat spec. This spec defines the
         # compressed files to adhere to the Zip spec.
         # Zip spec explicitly demands forward slashes '/' for our path.
-        path_arr = path.split("/")
-        if len(path_arr) == 1:
+        _, separator, normalized_path = path.partition("/")
+        if not separator:
             # We do not care about files sitting in our uncompressed root
             # directory.
             continue
 
-        normalized_path = "/".join(path_arr[1:])
-        normalized_dict[normalized_path] = files[path]
+        # popitem() drains in reverse insertion order, setdefault keeps the
+        # last archived file on path collisions just like a forward pass.
+        normalized_dict.setdefault(normalized_path, contents)
 
     return normalized_dict
 
 
-def extract_root_path(container_file: bytearray) -> List[str]:
+def extract_root_path(container_file: bytes) -> List[str]:
     tree = parse_as_etree(container_file)
 
-    root_files = tree.findall(
-        path=".//xmlns:rootfile[@media-type]",
-        namespaces={"xmlns": NAMESPACES["CONTAINERS"]},
-    )
-
+    # The XPath expression already filters out non OPF rootfiles.
     rootfiles: List[str] = []
+    root_files = cast(List[etree._Element], ROOTFILE_XPATH(tree))
     for root_file in root_files:
-        mediatype = root_file.get("media-type")
         fullpath = root_file.get("full-path")
-        if mediatype == "application/oebps-package+xml" and fullpath is not None:
+        if fullpath is not None:
             rootfiles.append(fullpath)
 
     return rootfiles
 
 
-def read_unzipped_chunks(file_chunks, is_textfile: bool) -> Optional[bytearray]:
-    file_bytes: Optional[bytearray] = None
-    for chunk in file_chunks:
-        # Whether we keep the bytes or not we still have to iterate over
-        # all the content to avoid corrupting the file. When this happens
-        # stream_unzip raises `UnfinishedIterationError`.
-        if not is_textfile:
-            continue
+def read_unzipped_chunks(file_chunks: Iterable[bytes]) -> Optional[bytes]:
+    # Chunks are collected and joined once at the end, growing a buffer
+    # chunk by chunk would copy it over and over again.
+    parts: List[bytes] = list(file_chunks)
 
-        if file_bytes is None:
-            file_bytes = bytearray(chunk)
-        else:
-            file_bytes += bytearray(chunk)
+    return b"".join(parts) if parts else None
 
-    return file_bytes
 
+def skip_unzipped_chunks(file_chunks: Iterable[bytes]) -> None:
+    # stream_unzip can't seek past a member, we still have to iterate over
+    # all the content to avoid corrupting the file. When this happens
+    # stream_unzip raises `UnfinishedIterationError`.
+    # A zero length deque exhausts the iterator without keeping any chunk.
+    deque(file_chunks, maxlen=0)
 
-def uncompress_epub(stream: IO[Any]) -> UncompressedEpub:
+
+def validate_rootfiles(rootfiles: List[str]) -> None:
+    if len(rootfiles) == 0:
+        msg = "No root file found in META-INF/container.xml definition."
+        msg += " (Epub is not correctly packaged, unable to find content)"
+        raise MalformedEpubException(msg)
+
+
+def uncompress_epub(stream: Iterable[bytes]) -> UncompressedEpub:
     # 'filepath' to 'binary contents' map.
-    files: Dict[str, bytearray] = dict()
+    files = ArenaFiles()
     rootfiles: List[str] = []
 
     for file_path, file_size, unzipped_chunks in stream_unzip(stream):
         filepath: str = decode(file_path)
-        filename: str = os.path.basename(filepath)
-        file_ext: str = pathlib.Path(filepath).suffix
+        # Plain string slicing, this runs for every member of the archive and
+        # pathlib objects are expensive to build.
+        filename: str = filepath.rpartition("/")[2]
 
-        # Skip files that don't have any text in them like css stylesheets
-        # or images.
-        is_textfile: bool = file_ext in CONTENT_FILETYPES
+        # Well-known files are settled before looking at extensions.
+        if filename == "container.xml":
+            container: Optional[bytes] = read_unzipped_chunks(unzipped_chunks)
+            if container is not None:
+                rootfiles = extract_root_path(container)
+            continue
 
-        current_bytes: Optional[bytearray] = read_unzipped_chunks(
-            unzipped_chunks, is_textfile
-        )
+        if filename == "mimetype":
+            is_textfile: bool = False
+        else:
+            # Skip files that don't have any text in them like css
+            # stylesheets or images.
+            dot: int = filename.rfind(".")
+            is_textfile = dot != -1 and filename[dot:] in CONTENT_FILETYPES
 
-        if current_bytes is None:
+        if not is_textfile:
+            skip_unzipped_chunks(unzipped_chunks)
             continue
 
-        if filename == "container.xml":
-            rootfiles = extract_root_path(current_bytes)
-        else:
-            files[filepath] = current_bytes
+        files.append(filepath, unzipped_chunks)
 
-    if len(rootfiles) == 0:
-        msg = "No root file found in META-INF/container.xml definition."
-        msg += " (Epub is not correctly packaged, unable to find content)"
-        raise MalformedEpubException(msg)
+    validate_rootfiles(rootfiles)
 
-    normalized_files = normalize_path(rootfiles=rootfiles, files=files)
-    return UncompressedEpub(files=normalized_files, rootfiles=rootfiles)
+    files.index = normalize_path(rootfiles=rootfiles, files=files.index)
+    return UncompressedEpub(files=files, rootfiles=rootfiles)
 
 
-def parse_as_etree(xml_data: bytearray, encoding: str = "utf-8") -> etree._Element:
+def prefetch_chunks(fp: IO[bytes]) -> Generator[bytes, None, None]:
     """
-    Pre-processes XML so lxml won't raise an exception if the XML has an
-    encoding tag in it.
+    Yields the contents of `fp` while a background thread reads the next
+    blocks ahead, so disk reads overlap with decompression.
     """
-    xml_as_string = decode(xml_data, encoding)
-    lxml_friendly_encoded_data = xml_as_string.encode(encoding)
-    return etree.fromstring(
-        text=lxml_friendly_encoded_data, parser=xml_parser_singleton
-    )
+    chunks: Queue[Union[bytes, BaseException]] = Queue(maxsize=PREFETCH_DEPTH)
+    done = threading.Event()
+
+    def produce() -> None:
+        try:
+            while not done.is_set():
+                chunk = fp.read(PREFETCH_CHUNK_SIZE)
+                chunks.put(chunk)
+                if not chunk:
+                    break
+        except BaseException as error:
+            chunks.put(error)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        done.set()
+        # The producer might be blocked on a full queue if we bailed out
+        # early, keep draining until it notices we are done.
+        while producer.is_alive():
+            with suppress(Empty):
+                chunks.get(timeout=0.01)
+
+
+def open_archive(archive: zipfile.ZipFile) -> UncompressedEpub:
+    # Same as with streamed epubs, container.xml might not sit in the
+    # uncompressed root directory (see `normalize_path`). Its parent
+    # directory is our OCF root.
+    root: str = ""
+    rootfiles: List[str] = []
+    for name in archive.namelist():
+        if name == CONTAINER_PATH or name.endswith(f"/{CONTAINER_PATH}"):
+            root = name[: -len(CONTAINER_PATH)]
+            rootfiles = extract_root_path(archive.read(name))
+            break
+
+    validate_rootfiles(rootfiles)
+
+    return UncompressedEpub(files=ArchivedFiles(archive, root), rootfiles=rootfiles)
+
+
+def parse_as_etree(xml_data: bytes) -> etree._Element:
+    """
+    Parses raw XML bytes. lxml only rejects encoding declarations on unicode
+    input, so handing over the undecoded bytes lets it honour them.
+    """
+    return etree.fromstring(text=xml_data, parser=get_xml_parser())
+
+
+def html_to_text(html_data: bytes) -> str:
+    """
+    Extracts the raw text of an (X)HTML document body, one line per
+    non-empty line of text.
+    """
+    # lxml returns no document at all for empty or blank input.
+    root = etree.HTML(html_data)
+    body = root.find("body") if root is not None else None
+    if body is None:
+        return ""
+
+    # Scripts and stylesheets are text nodes too as far as lxml is concerned.
+    etree.strip_elements(body, "script", "style", with_tail=False)
+
+    # Break lines at both ends of block elements so text from adjacent
+    # blocks doesn't get glued together.
+    for element in body.iter(*BLOCK_TAGS):
+        element.text = "\n" + (element.text or "")
+        element.tail = "\n" + (element.tail or "")
 
+    texts = cast(Iterator[str], body.itertext())
+    return normalize_text("".join(texts))
 
+
+def strip_html_tags(html_data: bytes) -> str:
+    """
+    Regex based counterpart of `html_to_text`. Much faster on the well formed
+    xhtml most epubs ship, but it doesn't understand malformed markup.
+    """
+    text = SKIPPED_BLOCKS_RE.sub(b"", html_data)
+    text = BLOCK_TAG_RE.sub(b"\n", text)
+    text = TAG_RE.sub(b"", text)
+
+    return normalize_text(html.unescape(decode(text)))
+
+
+def normalize_text(text: str) -> str:
+    lines = [line.strip() for line in text.splitlines()]
+    return "".join(f"{line}\n" for line in lines if line)
+
+
+def convert_documents(
+    documents: List[bytes], strict: bool = False, executor: Optional[Executor] = None
+) -> List[str]:
+    # Strict mode parses every document instead of stripping its tags.
+    convert = html_to_text if strict else strip_html_tags
+
+    # Documents are independent from each other, so callers may spread the
+    # conversion over their own executor. We never start one ourselves:
+    # process pools need an import guarded main module and don't work from
+    # daemonic processes.
+    if executor is None or len(documents) < PARALLEL_THRESHOLD:
+        return [convert(document) for document in documents]
+
+    return list(executor.map(convert, documents, chunksize=4))
+
+
+@lru_cache(maxsize=64)
 def fix_mediatype(mediatype: Optional[str]) -> Optional[str]:
     """
     Override common mistakes.
@@ -193,53 +544,135 @@ def fix_mediatype(mediatype: Optional[str]) -> Optional[str]:
         return mediatype
 
 
-def extract_textfiles(
-    rootfile: bytearray, files: Dict[str, bytearray], root_dir: str
-) -> Epub:
-    tree = parse_as_etree(rootfile)
-    manifest = tree.find("{%s}%s" % (NAMESPACES["OPF"], "manifest"))
+def iter_manifest_items(rootfile: bytes) -> Iterator[etree._Element]:
+    """
+    Yields the items of the package's manifest, that is, its first manifest
+    sitting right under the root element.
+    """
+    # Manifests can list thousands of items, so instead of building the
+    # whole tree we stream it and drop every element once we are done
+    # with it.
+    elements = etree.iterparse(
+        io.BytesIO(rootfile),
+        tag=(OPF_MANIFEST, OPF_ITEM),
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+        collect_ids=False,
+    )
+
+    has_manifest: bool = False
+    for _, element in elements:
+        if element.tag == OPF_MANIFEST:
+            has_manifest = has_manifest or is_package_child(element)
+
+        # Items of any later manifest end after the first one did.
+        elif not has_manifest and any(
+            is_package_child(manifest)
+            for manifest in element.iterancestors(OPF_MANIFEST)
+        ):
+            yield element
+
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        while parent is not None and element.getprevious() is not None:
+            del parent[0]
 
-    if manifest is None:
+    if not has_manifest:
         raise MalformedEpubException("Rootfile has no manifest")
 
-    texts: List[str] = []
-    for item in manifest.iter():
-        if item.tag != "{%s}item" % NAMESPACES["OPF"]:
-            continue
 
-        media_type = fix_mediatype(item.get("media-type", None))
+def is_package_child(element: etree._Element) -> bool:
+    parent = element.getparent()
+    return parent is not None and parent.getparent() is None
 
-        if media_type == "application/xhtml+xml":
-            filepath: str | None = item.get("href", None)
-            if filepath is None:
-                continue
 
-            # Our path here is relative to our root directory so we have to
-            # prepend it.
-            normalized_path: str = f"{root_dir}/{filepath}"
-            contents: bytearray = files[normalized_path]
+def extract_textfiles(
+    rootfile: bytes,
+    files: Mapping[str, bytes],
+    root_dir: str,
+    strict: bool = False,
+    executor: Optional[Executor] = None,
+) -> Epub:
+    # Hrefs are relative to our root directory so we have to prepend it.
+    root_prefix: str = root_dir + "/"
+
+    documents: List[bytes] = []
+    for item in iter_manifest_items(rootfile):
+        # fix_mediatype only overrides image mediatypes, which we don't
+        # care about here.
+        if item.get("media-type") != XHTML_MEDIATYPE:
+            continue
 
-            str_data = decode(contents)
-            texts.append(html2text.html2text(str_data))
+        filepath: str | None = item.get("href", None)
+        if filepath is None:
+            continue
+
+        # Manifest entries pointing to missing files are skipped.
+        contents: Optional[bytes] = files.get(root_prefix + filepath)
+        if contents is not None:
+            documents.append(contents)
 
-    return Epub(texts=texts)
+    return Epub(texts=convert_documents(documents, strict, executor))
 
 
-def read_uncompressed_epubs(uncompressed_epub: UncompressedEpub) -> List[Epub]:
+def read_uncompressed_epubs(
+    uncompressed_epub: UncompressedEpub,
+    strict: bool = False,
+    executor: Optional[Executor] = None,
+) -> List[Epub]:
     publications: List[Epub] = []
     for rootfile_path in uncompressed_epub.rootfiles:
         rootfile_dir: str = rootfile_path.split("/")[0]
-        rootfile: bytearray = uncompressed_epub.files[rootfile_path]
-        epub = extract_textfiles(rootfile, uncompressed_epub.files, rootfile_dir)
+        rootfile: bytes = uncompressed_epub.files[rootfile_path]
+        epub = extract_textfiles(
+            rootfile, uncompressed_epub.files, rootfile_dir, strict, executor
+        )
 
         publications.append(epub)
 
     return publications
 
 
-def read(stream: IO[Any]) -> List[Epub]:
+def read(
+    stream: IO[Any], strict: bool = False, executor: Optional[Executor] = None
+) -> List[Epub]:
+    """
+    Reads every publication in the epub. Text is extracted by stripping
+    markup tags unless `strict` is set, in which case every document is
+    parsed as HTML, which copes better with malformed markup.
+
+    Documents are converted serially unless an `executor` is given, e.g. a
+    `ProcessPoolExecutor` for books with many chapters.
+    """
     uncompressed_epub = uncompress_epub(stream)
 
-    epubs = read_uncompressed_epubs(uncompressed_epub)
+    epubs = read_uncompressed_epubs(uncompressed_epub, strict, executor)
 
     return epubs
+
+
+def read_from_path(
+    path: str, strict: bool = False, executor: Optional[Executor] = None
+) -> List[Epub]:
+    """
+    Reads an epub sitting on disk. Unlike `read`, only container.xml, the
+    rootfiles and their xhtml documents are ever decompressed.
+    """
+    with zipfile.ZipFile(path) as archive:
+        uncompressed_epub = open_archive(archive)
+
+        return read_uncompressed_epubs(uncompressed_epub, strict, executor)
+
+
+def read_async(
+    path: str, strict: bool = False, executor: Optional[Executor] = None
+) -> List[Epub]:
+    """
+    Same as `read`, but the file is read ahead in a background thread while
+    members are being inflated.
+    """
+    with open(path, "rb") as fp, closing(prefetch_chunks(fp)) as chunks:
+        uncompressed_epub = uncompress_epub(chunks)
+
+    return read_uncompressed_epubs(uncompressed_epub, strict, executor)
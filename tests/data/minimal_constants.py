@@ -33,10 +33,12 @@ https://github.com/thansen0/sample-epub-minimal
 """
 
 
-MINIMAL_TOC = '# Table of Contents\n\n  1. [Chapter 1](chapter_1.xhtml)\n  2. [Chapter 2](chapter_2.xhtml)\n  3. [Copyright](copyright.xhtml)\n\n'
+MINIMAL_TOC = 'Table of Contents\nChapter 1\nChapter 2\nCopyright\n'
 
-MINIMAL_CHAPTER1 = '# Chapter 1\n\nLorem ipsum dolor sit amet, consectetur adipiscing elit. Morbi id lectus\ndictum, lobortis urna a, luctus libero. Integer ultricies nisi nec nisi\ngravida, sit amet tempor diam posuere. Morbi consequat libero fringilla\npellentesque venenatis. Donec ut porta metus. Etiam condimentum cursus elit\npulvinar gravida. Nulla consequat interdum leo sed tincidunt. Suspendisse\npotenti. Integer pretium cursus libero, eu ornare erat dictum eu. Cras\nultrices mi vel odio tempus fringilla. Nulla tristique nisi nisl, id\nscelerisque risus gravida a. Proin neque tellus, efficitur eu dictum\nhendrerit, lacinia vel neque. Proin augue risus, maximus ac eros consectetur,\nfinibus mattis metus. Donec ut dictum diam. Vestibulum tempor orci id ultrices\nlacinia. Praesent bibendum, mi vitae euismod condimentum, eros enim tincidunt\nodio, id semper erat nisl vitae nisi. Nunc convallis mi sit amet velit\nvenenatis vestibulum ac at mauris.\n\nDuis vestibulum elit non tortor luctus ultrices. Nulla facilisi. Aliquam\nrhoncus, est at elementum semper, tortor risus pretium diam, eget condimentum\nipsum felis eget sapien. Nullam elit urna, lacinia a metus luctus, varius\nultrices lectus. In pellentesque erat sit amet magna fringilla, in luctus\nlectus accumsan. Nulla tincidunt dignissim eleifend. Duis lacinia risus\nfacilisis lacus tempor, et facilisis est ornare. Quisque vel sem congue,\nvarius eros in, consequat purus. Nulla sodales id dui ut fermentum. Vestibulum\nsed justo sed sapien placerat congue. Nam in bibendum purus.\n\nLorem ipsum dolor sit amet, consectetur adipiscing elit. In tincidunt, ex sed\nlobortis interdum, purus dui fermentum ex, non dictum ex quam eu nunc.\nSuspendisse potenti. Aenean ultricies commodo hendrerit. Etiam tristique\nsagittis tellus. Aliquam erat volutpat. Maecenas vitae tristique nulla. Sed\nvitae volutpat ex, et hendrerit ipsum. Nullam vehicula velit vitae vehicula\nmaximus.\n\nPraesent ut nisi pellentesque, cursus nulla ac, vulputate leo. Fusce\nultricies, magna cursus vestibulum viverra, erat eros maximus ex, id faucibus\nrisus augue in sapien. Quisque tortor augue, pulvinar ac felis at, bibendum\nsollicitudin massa. Lorem ipsum dolor sit amet, consectetur adipiscing elit.\nSed mauris ipsum, sollicitudin facilisis velit non, tempus accumsan purus.\nDonec eget pharetra ipsum. Nullam vulputate malesuada ipsum sed mollis. Nulla\nporta elit nec egestas consequat. Fusce a purus viverra, ultrices sapien in,\nvarius leo. Nam at tellus vel tortor pulvinar pulvinar sed sit amet ex.\nQuisque vestibulum placerat massa, ut porta eros blandit euismod. Nullam vitae\nnulla sed neque eleifend lobortis sed non lacus. Etiam vulputate mollis sapien\nsed ornare.\n\nNullam eros diam, hendrerit vel nibh in, malesuada aliquet massa. Nam blandit\negestas massa, sit amet efficitur erat luctus vel. In eu leo at nibh egestas\nvenenatis vel nec eros. Nulla bibendum sapien vel velit iaculis, in feugiat\nrisus vestibulum. Suspendisse placerat laoreet eros, et ullamcorper est ornare\neu. Praesent imperdiet lacus vel vehicula accumsan. Donec fringilla odio\nvelit. Cras tempus est in lacus eleifend, cursus pellentesque lorem vehicula.\nUt metus turpis, posuere eget imperdiet eget, bibendum in tortor. Mauris id\ndolor tellus. Suspendisse at nisi tellus. Duis lectus arcu, pulvinar et\npretium in, tincidunt facilisis nulla. Nulla ullamcorper aliquam ullamcorper.\nNunc ultricies nibh vitae urna hendrerit varius.\n\n'
+MINIMAL_CHAPTER1 = 'Chapter 1\nLorem ipsum dolor sit amet, consectetur adipiscing elit. Morbi id lectus dictum, lobortis urna a, luctus libero. Integer ultricies nisi nec nisi gravida, sit amet tempor diam posuere. Morbi consequat libero fringilla pellentesque venenatis. Donec ut porta metus. Etiam condimentum cursus elit pulvinar gravida. Nulla consequat interdum leo sed tincidunt. Suspendisse potenti. Integer pretium cursus libero, eu ornare erat dictum eu. Cras ultrices mi vel odio tempus fringilla. Nulla tristique nisi nisl, id scelerisque risus gravida a. Proin neque tellus, efficitur eu dictum hendrerit, lacinia vel neque. Proin augue risus, maximus ac eros consectetur, finibus mattis metus. Donec ut dictum diam. Vestibulum tempor orci id ultrices lacinia. Praesent bibendum, mi vitae euismod condimentum, eros enim tincidunt odio, id semper erat nisl vitae nisi. Nunc convallis mi sit amet velit venenatis vestibulum ac at mauris.\nDuis vestibulum elit non tortor luctus ultrices. Nulla facilisi. Aliquam rhoncus, est at elementum semper, tortor risus pretium diam, eget condimentum ipsum felis eget sapien. Nullam elit urna, lacinia a metus luctus, varius ultrices lectus. In pellentesque erat sit amet magna fringilla, in luctus lectus accumsan. Nulla tincidunt dignissim eleifend. Duis lacinia risus facilisis lacus tempor, et facilisis est ornare. Quisque vel sem congue, varius eros in, consequat purus. Nulla sodales id dui ut fermentum. Vestibulum sed justo sed sapien placerat congue. Nam in bibendum purus.\nLorem ipsum dolor sit amet, consectetur adipiscing elit. In tincidunt, ex sed lobortis interdum, purus dui fermentum ex, non dictum ex quam eu nunc. Suspendisse potenti. Aenean ultricies commodo hendrerit. Etiam tristique sagittis tellus. Aliquam erat volutpat. Maecenas vitae tristique nulla. Sed vitae volutpat ex, et hendrerit ipsum. Nullam vehicula velit vitae vehicula maximus.\nPraesent ut nisi pellentesque, cursus nulla ac, vulputate leo. Fusce ultricies, magna cursus vestibulum viverra, erat eros maximus ex, id faucibus risus augue in sapien. Quisque tortor augue, pulvinar ac felis at, bibendum sollicitudin massa. Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed mauris ipsum, sollicitudin facilisis velit non, tempus accumsan purus. Donec eget pharetra ipsum. Nullam vulputate malesuada ipsum sed mollis. Nulla porta elit nec egestas consequat. Fusce a purus viverra, ultrices sapien in, varius leo. Nam at tellus vel tortor pulvinar pulvinar sed sit amet ex. Quisque vestibulum placerat massa, ut porta eros blandit euismod. Nullam vitae nulla sed neque eleifend lobortis sed non lacus. Etiam vulputate mollis sapien sed ornare.\nNullam eros diam, hendrerit vel nibh in, malesuada aliquet massa. Nam blandit egestas massa, sit amet efficitur erat luctus vel. In eu leo at nibh egestas venenatis vel nec eros. Nulla bibendum sapien vel velit iaculis, in feugiat risus vestibulum. Suspendisse placerat laoreet eros, et ullamcorper est ornare eu. Praesent imperdiet lacus vel vehicula accumsan. Donec fringilla odio velit. Cras tempus est in lacus eleifend, cursus pellentesque lorem vehicula. Ut metus turpis, posuere eget imperdiet eget, bibendum in tortor. Mauris id dolor tellus. Suspendisse at nisi tellus. Duis lectus arcu, pulvinar et pretium in, tincidunt facilisis nulla. Nulla ullamcorper aliquam ullamcorper. Nunc ultricies nibh vitae urna hendrerit varius.\n'
+
+MINIMAL_CHAPTER2 = 'Chapter 2\nLorem ipsum dolor sit amet, consectetur adipiscing elit. Maecenas id ex urna. Quisque at fringilla ex. Aliquam erat volutpat. Nullam ac dignissim eros, sed iaculis dolor. Nullam sit amet libero convallis, porttitor nisl sed, pulvinar dolor. Vivamus ornare libero ipsum, eget interdum lorem viverra sed. Praesent sollicitudin viverra mauris ut gravida. Cras nec lorem id velit malesuada auctor. Pellentesque dignissim tortor vel tempus mattis. Integer sapien tortor, dignissim non purus eget, laoreet convallis dolor. Morbi vitae ante non tortor pharetra rutrum. Fusce pretium sapien nulla, sed pretium tortor ultrices sit amet.\nMorbi sed euismod est, ut sodales erat. In hac habitasse platea dictumst. Mauris ipsum diam, venenatis vitae turpis sit amet, blandit consectetur arcu. Aliquam non aliquet augue, in pharetra velit. Quisque dapibus bibendum lorem sed rutrum. Maecenas blandit sit amet lorem tempus viverra. Nulla commodo, orci sed eleifend efficitur, felis est dapibus felis, non mollis nibh tellus quis nunc. Curabitur vulputate velit orci. Duis laoreet erat augue. Maecenas nisi enim, congue vitae accumsan quis, tincidunt quis velit. Morbi vel leo ultricies, bibendum nibh at, posuere massa. Integer iaculis scelerisque elit.\nCras id porttitor nulla, eget consequat dui. Praesent volutpat placerat lorem a semper. Nulla facilisi. Vestibulum at tincidunt velit, ac consectetur diam. Nunc non arcu eget orci bibendum fermentum sed eget sapien. Vivamus rutrum scelerisque consectetur. Mauris nec augue sed est dignissim sagittis. Praesent ac urna quis justo ornare convallis quis et justo. Proin nunc metus, malesuada a nibh sit amet, eleifend facilisis tortor.\nCurabitur at consequat lorem, sollicitudin consequat elit. Morbi tempor non justo non hendrerit. Donec sit amet consectetur odio. Mauris cursus elit a vestibulum rutrum. Aliquam varius sit amet nulla vel lobortis. Curabitur dictum arcu velit, id feugiat turpis blandit a. Mauris euismod urna ac metus fringilla, sit amet vestibulum neque sagittis. Aenean et luctus nibh. Suspendisse sit amet scelerisque lacus, eget rutrum augue. Sed finibus id dolor vitae tempor. Duis convallis sit amet lacus eu porttitor. Mauris tempus, mi ut porta faucibus, ex enim mattis ante, et efficitur ipsum lectus at diam. Nunc ut ullamcorper odio. Nunc varius pulvinar elit nec faucibus. Donec nec diam tempus, congue lorem vel, elementum justo. Mauris auctor enim non nisi finibus placerat.\nFusce vel lobortis sem, id mollis dui. Fusce iaculis erat magna, quis dignissim sapien porttitor ultrices. Duis ornare ipsum neque, ut sodales nulla elementum vel. Ut quam nibh, laoreet in orci sit amet, tristique imperdiet arcu. Fusce vitae hendrerit metus, sit amet porta erat. Duis finibus egestas mauris, eu volutpat nisi tempus in. Sed porttitor leo massa, ut condimentum dui lacinia sed. Morbi varius, augue et dignissim venenatis, erat ligula luctus nibh, et vulputate quam arcu at quam. Praesent faucibus ex lorem, a volutpat quam varius eu. Fusce efficitur iaculis diam, non sagittis neque imperdiet volutpat. Ut in velit dignissim, malesuada nunc non, iaculis massa. In hac habitasse platea dictumst.\nIn tincidunt urna in est dapibus, non gravida orci lobortis. Pellentesque quis sem nec felis dictum sollicitudin a in magna. Integer tristique placerat est ut congue. Maecenas tincidunt purus vel purus convallis, id molestie enim tincidunt. Curabitur lobortis ac sapien sed accumsan. Quisque dapibus lacus lacus, nec rhoncus mauris viverra at. Integer leo magna, porta at euismod vel, placerat at lorem. Cras consequat sapien et scelerisque faucibus. Integer ultrices fermentum lacus, sed posuere nisl lobortis efficitur. Morbi aliquet lorem ut ante consequat consectetur. Quisque vel velit sed nisi tristique placerat quis in massa.\nCras in est sem. Aliquam feugiat odio lorem, vel tempor massa laoreet at. Fusce ac porttitor felis. Donec ultrices urna mi, vitae vulputate mi faucibus sed. Curabitur in dui diam. Class aptent taciti sociosqu ad litora torquent per conubia nostra, per inceptos himenaeos. Nam eu finibus elit. Aenean laoreet pharetra erat, sit amet fermentum erat interdum sodales. Vestibulum ut lectus condimentum, vestibulum mi non, venenatis nunc. Fusce elementum arcu leo, ac rhoncus neque eleifend a.\nProin massa arcu, interdum quis nibh volutpat, mattis pharetra leo. Sed tempus elit ac nunc feugiat, vel pharetra lorem dapibus. Aenean gravida neque sed orci viverra sagittis. Nunc semper sed ipsum quis laoreet. Cras sodales lacinia ornare. Proin sed mauris tortor. Ut sagittis diam augue, nec porta ante vehicula id. Cras gravida magna sollicitudin felis consequat, gravida posuere diam pulvinar. Vestibulum aliquam justo luctus ultrices iaculis. Nam vel hendrerit libero.\nInteger tincidunt facilisis dapibus. Integer viverra porta risus, a sagittis nulla congue sit amet. Cras placerat pulvinar pharetra. Nam malesuada tempor odio at suscipit. Morbi est mauris, facilisis vel dolor in, tincidunt rutrum erat. Phasellus quis ex feugiat, pharetra nisi eu, dapibus lacus. Sed tempus a felis id rhoncus. Pellentesque vel pellentesque lacus. Ut ut consectetur diam. Maecenas vitae rutrum erat, quis porta massa. Proin in tellus at metus tempus condimentum. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia Curae; Aliquam ac egestas est. Vivamus hendrerit tempor dui, eu vehicula elit. Quisque felis felis, faucibus sit amet ligula at, porta elementum metus. Suspendisse iaculis metus vitae enim tincidunt, quis fermentum leo cursus.\nProin a lobortis justo. Morbi metus ante, tempor id augue sit amet, finibus luctus nibh. Sed efficitur vehicula posuere. Fusce rutrum placerat auctor. Vestibulum ut sollicitudin purus. Praesent ullamcorper ex nisi, vitae finibus risus congue eu. Fusce volutpat efficitur commodo. Fusce pulvinar lobortis sodales. Proin eget eros ac augue pulvinar efficitur. Mauris at condimentum mi. Sed sit amet mi vel tortor interdum cursus.\n'
+
+MINIMAL_COPYRIGHT = 'Copyright\nYou can create all sorts of pages that are not chapters as well, and simply give them different names.  As an idea you could use a page like this, and either list your name as the copyright or list it under another copyright, such as the GNU Licesnse\n'
 
-MINIMAL_CHAPTER2 = '# Chapter 2\n\nLorem ipsum dolor sit amet, consectetur adipiscing elit. Maecenas id ex urna.\nQuisque at fringilla ex. Aliquam erat volutpat. Nullam ac dignissim eros, sed\niaculis dolor. Nullam sit amet libero convallis, porttitor nisl sed, pulvinar\ndolor. Vivamus ornare libero ipsum, eget interdum lorem viverra sed. Praesent\nsollicitudin viverra mauris ut gravida. Cras nec lorem id velit malesuada\nauctor. Pellentesque dignissim tortor vel tempus mattis. Integer sapien\ntortor, dignissim non purus eget, laoreet convallis dolor. Morbi vitae ante\nnon tortor pharetra rutrum. Fusce pretium sapien nulla, sed pretium tortor\nultrices sit amet.\n\nMorbi sed euismod est, ut sodales erat. In hac habitasse platea dictumst.\nMauris ipsum diam, venenatis vitae turpis sit amet, blandit consectetur arcu.\nAliquam non aliquet augue, in pharetra velit. Quisque dapibus bibendum lorem\nsed rutrum. Maecenas blandit sit amet lorem tempus viverra. Nulla commodo,\norci sed eleifend efficitur, felis est dapibus felis, non mollis nibh tellus\nquis nunc. Curabitur vulputate velit orci. Duis laoreet erat augue. Maecenas\nnisi enim, congue vitae accumsan quis, tincidunt quis velit. Morbi vel leo\nultricies, bibendum nibh at, posuere massa. Integer iaculis scelerisque elit.\n\nCras id porttitor nulla, eget consequat dui. Praesent volutpat placerat lorem\na semper. Nulla facilisi. Vestibulum at tincidunt velit, ac consectetur diam.\nNunc non arcu eget orci bibendum fermentum sed eget sapien. Vivamus rutrum\nscelerisque consectetur. Mauris nec augue sed est dignissim sagittis. Praesent\nac urna quis justo ornare convallis quis et justo. Proin nunc metus, malesuada\na nibh sit amet, eleifend facilisis tortor.\n\nCurabitur at consequat lorem, sollicitudin consequat elit. Morbi tempor non\njusto non hendrerit. Donec sit amet consectetur odio. Mauris cursus elit a\nvestibulum rutrum. Aliquam varius sit amet nulla vel lobortis. Curabitur\ndictum arcu velit, id feugiat turpis blandit a. Mauris euismod urna ac metus\nfringilla, sit amet vestibulum neque sagittis. Aenean et luctus nibh.\nSuspendisse sit amet scelerisque lacus, eget rutrum augue. Sed finibus id\ndolor vitae tempor. Duis convallis sit amet lacus eu porttitor. Mauris tempus,\nmi ut porta faucibus, ex enim mattis ante, et efficitur ipsum lectus at diam.\nNunc ut ullamcorper odio. Nunc varius pulvinar elit nec faucibus. Donec nec\ndiam tempus, congue lorem vel, elementum justo. Mauris auctor enim non nisi\nfinibus placerat.\n\nFusce vel lobortis sem, id mollis dui. Fusce iaculis erat magna, quis\ndignissim sapien porttitor ultrices. Duis ornare ipsum neque, ut sodales nulla\nelementum vel. Ut quam nibh, laoreet in orci sit amet, tristique imperdiet\narcu. Fusce vitae hendrerit metus, sit amet porta erat. Duis finibus egestas\nmauris, eu volutpat nisi tempus in. Sed porttitor leo massa, ut condimentum\ndui lacinia sed. Morbi varius, augue et dignissim venenatis, erat ligula\nluctus nibh, et vulputate quam arcu at quam. Praesent faucibus ex lorem, a\nvolutpat quam varius eu. Fusce efficitur iaculis diam, non sagittis neque\nimperdiet volutpat. Ut in velit dignissim, malesuada nunc non, iaculis massa.\nIn hac habitasse platea dictumst.\n\nIn tincidunt urna in est dapibus, non gravida orci lobortis. Pellentesque quis\nsem nec felis dictum sollicitudin a in magna. Integer tristique placerat est\nut congue. Maecenas tincidunt purus vel purus convallis, id molestie enim\ntincidunt. Curabitur lobortis ac sapien sed accumsan. Quisque dapibus lacus\nlacus, nec rhoncus mauris viverra at. Integer leo magna, porta at euismod vel,\nplacerat at lorem. Cras consequat sapien et scelerisque faucibus. Integer\nultrices fermentum lacus, sed posuere nisl lobortis efficitur. Morbi aliquet\nlorem ut ante consequat consectetur. Quisque vel velit sed nisi tristique\nplacerat quis in massa.\n\nCras in est sem. Aliquam feugiat odio lorem, vel tempor massa laoreet at.\nFusce ac porttitor felis. Donec ultrices urna mi, vitae vulputate mi faucibus\nsed. Curabitur in dui diam. Class aptent taciti sociosqu ad litora torquent\nper conubia nostra, per inceptos himenaeos. Nam eu finibus elit. Aenean\nlaoreet pharetra erat, sit amet fermentum erat interdum sodales. Vestibulum ut\nlectus condimentum, vestibulum mi non, venenatis nunc. Fusce elementum arcu\nleo, ac rhoncus neque eleifend a.\n\nProin massa arcu, interdum quis nibh volutpat, mattis pharetra leo. Sed tempus\nelit ac nunc feugiat, vel pharetra lorem dapibus. Aenean gravida neque sed\norci viverra sagittis. Nunc semper sed ipsum quis laoreet. Cras sodales\nlacinia ornare. Proin sed mauris tortor. Ut sagittis diam augue, nec porta\nante vehicula id. Cras gravida magna sollicitudin felis consequat, gravida\nposuere diam pulvinar. Vestibulum aliquam justo luctus ultrices iaculis. Nam\nvel hendrerit libero.\n\nInteger tincidunt facilisis dapibus. Integer viverra porta risus, a sagittis\nnulla congue sit amet. Cras placerat pulvinar pharetra. Nam malesuada tempor\nodio at suscipit. Morbi est mauris, facilisis vel dolor in, tincidunt rutrum\nerat. Phasellus quis ex feugiat, pharetra nisi eu, dapibus lacus. Sed tempus a\nfelis id rhoncus. Pellentesque vel pellentesque lacus. Ut ut consectetur diam.\nMaecenas vitae rutrum erat, quis porta massa. Proin in tellus at metus tempus\ncondimentum. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices\nposuere cubilia Curae; Aliquam ac egestas est. Vivamus hendrerit tempor dui,\neu vehicula elit. Quisque felis felis, faucibus sit amet ligula at, porta\nelementum metus. Suspendisse iaculis metus vitae enim tincidunt, quis\nfermentum leo cursus.\n\nProin a lobortis justo. Morbi metus ante, tempor id augue sit amet, finibus\nluctus nibh. Sed efficitur vehicula posuere. Fusce rutrum placerat auctor.\nVestibulum ut sollicitudin purus. Praesent ullamcorper ex nisi, vitae finibus\nrisus congue eu. Fusce volutpat efficitur commodo. Fusce pulvinar lobortis\nsodales. Proin eget eros ac augue pulvinar efficitur. Mauris at condimentum\nmi. Sed sit amet mi vel tortor interdum cursus.\n\n'
 
-MINIMAL_COPYRIGHT = '# Copyright\n\nYou can create all sorts of pages that are not chapters as well, and simply\ngive them different names. As an idea you could use a page like this, and\neither list your name as the copyright or list it under another copyright,\nsuch as the [GNU\nLicesnse](https://en.wikipedia.org/wiki/GNU_General_Public_License)\n\n'
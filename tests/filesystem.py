@@ -1,9 +1,10 @@
 
 import io
+import mmap
 import pathlib
 import os
 from typing import Any, IO
-from functools import cache, lru_cache
+from functools import cache
 
 DATA_DIR: str = "data"
 
@@ -13,10 +14,17 @@ def get_data_dir() -> pathlib.Path:
     datadir: str = os.path.join(testdir, DATA_DIR)
     return pathlib.Path(datadir).resolve()
 
-@lru_cache
-def open_test_file(filename: str) -> IO[Any]:
+@cache
+def map_test_file(filename: str) -> mmap.mmap:
     datadir: pathlib.Path = get_data_dir()
     filepath: str = os.path.join(datadir, filename)
 
-    return io.open(file=filepath, mode='br')
+    # The mapping keeps its own descriptor, ours can be closed right away.
+    with io.open(file=filepath, mode='br') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+def open_test_file(filename: str) -> IO[Any]:
+    # Every caller gets its own stream, sharing a file handle would leave
+    # it exhausted for whoever reads it next.
+    return io.BytesIO(map_test_file(filename))
 
@@ -0,0 +1,61 @@
+"""
+Synthetic epubs covering archive layouts the minimal fixture doesn't: OCF
+roots at the top of the archive or nested in a directory, and manifests
+pointing to files that are missing from the archive or empty.
+"""
+
+import os
+import zipfile
+import pytest
+from typing import Callable, List
+from epublib.reader import Epub
+from tests.reader.test_minimal import READERS
+
+CONTAINER = b"""<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+    <rootfiles>
+        <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+    </rootfiles>
+</container>
+"""
+
+CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+    <manifest>
+        <item id="one" href="one.xhtml" media-type="application/xhtml+xml"/>
+        <item id="missing" href="missing.xhtml" media-type="application/xhtml+xml"/>
+        <item id="empty" href="empty.xhtml" media-type="application/xhtml+xml"/>
+        <item id="two" href="two.xhtml" media-type="application/xhtml+xml"/>
+    </manifest>
+</package>
+"""
+
+
+def chapter(text: str) -> bytes:
+    return b"<html><body><p>%s</p></body></html>" % text.encode("utf-8")
+
+
+def write_epub(filepath: str, root: str) -> None:
+    with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"{root}mimetype", "application/epub+zip")
+        archive.writestr(f"{root}META-INF/container.xml", CONTAINER)
+        archive.writestr(f"{root}OEBPS/content.opf", CONTENT)
+        archive.writestr(f"{root}OEBPS/one.xhtml", chapter("One"))
+        archive.writestr(f"{root}OEBPS/empty.xhtml", b"")
+        archive.writestr(f"{root}OEBPS/two.xhtml", chapter("Two"))
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("root", ["", "nested/"])
+@pytest.mark.parametrize("reader", READERS)
+def test_manifest_items(
+    tmp_path, reader: Callable[..., List[Epub]], root: str, strict: bool
+):
+    filepath = os.path.join(tmp_path, "synthetic.epub")
+    write_epub(filepath, root)
+
+    epubs: List[Epub] = reader(filepath, strict=strict)
+
+    # Missing files are skipped, empty ones still yield their (empty) text.
+    assert len(epubs) == 1
+    assert epubs[0].texts == ["One\n", "", "Two\n"]
@@ -0,0 +1,50 @@
+import pytest
+from epublib.reader import (
+    MalformedEpubException,
+    extract_textfiles,
+    iter_manifest_items,
+)
+
+PACKAGE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+    <metadata/>
+    %s
+</package>
+"""
+
+MANIFEST = b"""<manifest>
+        <item id="one" href="one.xhtml" media-type="application/xhtml+xml"/>
+        <item id="css" href="style.css" media-type="text/css"/>
+        <item id="two" href="two.xhtml" media-type="application/xhtml+xml"/>
+    </manifest>"""
+
+
+def test_no_manifest():
+    with pytest.raises(MalformedEpubException):
+        extract_textfiles(PACKAGE % b"<spine/>", {}, "OEBPS")
+
+
+def test_nested_manifest():
+    # Only a manifest sitting right under the package counts.
+    rootfile = PACKAGE % (b"<metadata>%s</metadata>" % MANIFEST)
+
+    with pytest.raises(MalformedEpubException):
+        list(iter_manifest_items(rootfile))
+
+
+def test_first_manifest_only():
+    second = MANIFEST.replace(b"one.xhtml", b"three.xhtml")
+    rootfile = PACKAGE % (MANIFEST + second)
+
+    hrefs = [item.get("href") for item in iter_manifest_items(rootfile)]
+
+    assert hrefs == ["one.xhtml", "style.css", "two.xhtml"]
+
+
+def test_items_are_pruned():
+    for item in iter_manifest_items(PACKAGE % MANIFEST):
+        # Only the last handed out item is left behind, already cleared.
+        previous = item.getprevious()
+        if previous is not None:
+            assert previous.getprevious() is None
+            assert previous.get("href") is None
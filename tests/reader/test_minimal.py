@@ -1,12 +1,17 @@
-from typing import List
-from epublib.reader import Epub, read
+import copy
+import io
+import os
+import pickle
+import pytest
+from typing import Callable, List
+from epublib.reader import Epub, read, read_async, read_from_path
 from tests.data.minimal_constants import (
     MINIMAL_CHAPTER1,
     MINIMAL_CHAPTER2,
     MINIMAL_COPYRIGHT,
     MINIMAL_TOC,
 )
-from tests.filesystem import open_test_file
+from tests.filesystem import get_data_dir, open_test_file
 
 
 def test_ok():
@@ -29,3 +34,92 @@ def test_ok():
     )
 
     assert contents == expected_contents
+
+    output = io.StringIO()
+    epubs[0].write_to(output)
+
+    assert output.getvalue() == expected_contents
+
+
+def read_stream(path: str, strict: bool = False) -> List[Epub]:
+    with open(path, "rb") as fp:
+        return read(fp, strict=strict)
+
+
+# Every entry point, they all have to agree on their output.
+READERS = [read_stream, read_from_path, read_async]
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("reader", READERS)
+def test_readers(reader: Callable[..., List[Epub]], strict: bool):
+    filepath = os.path.join(get_data_dir(), "minimal.epub")
+    epubs: List[Epub] = reader(filepath, strict=strict)
+
+    assert len(epubs) == 1
+
+    texts = epubs[0].texts
+
+    assert texts == [MINIMAL_TOC, MINIMAL_CHAPTER1, MINIMAL_CHAPTER2, MINIMAL_COPYRIGHT]
+
+
+def test_read_twice():
+    first: List[Epub] = read(open_test_file("minimal.epub"))
+    second: List[Epub] = read(open_test_file("minimal.epub"))
+
+    assert first[0].texts == second[0].texts
+
+
+def test_pickle():
+    epub: Epub = read(open_test_file("minimal.epub"))[0]
+
+    buffers: List[pickle.PickleBuffer] = []
+    data = pickle.dumps(epub, protocol=5, buffer_callback=buffers.append)
+    restored: Epub = pickle.loads(data, buffers=buffers)
+
+    assert len(buffers) == len(epub.texts)
+    assert restored.texts == epub.texts
+
+    restored = pickle.loads(pickle.dumps(epub, protocol=4))
+
+    assert restored.texts == epub.texts
+
+    assert copy.copy(epub).texts == epub.texts
+
+
+class DerivedEpub(Epub):
+    pass
+
+
+def test_pickle_subclass():
+    epub = DerivedEpub(texts=[MINIMAL_TOC])
+
+    for protocol in (4, 5):
+        restored = pickle.loads(pickle.dumps(epub, protocol=protocol))
+
+        assert type(restored) is DerivedEpub
+        assert restored.texts == epub.texts
+
+
+def test_protobuf(tmp_path):
+    epub: Epub = read(open_test_file("minimal.epub"))[0]
+
+    filepath = os.path.join(tmp_path, "minimal.pb")
+    epub.to_protobuf(filepath)
+    restored: Epub = Epub.from_protobuf(filepath)
+
+    assert restored.texts == epub.texts
+
+
+def test_protobuf_unknown_fields(tmp_path):
+    filepath = os.path.join(tmp_path, "unknown.pb")
+    with open(filepath, "wb") as fp:
+        # Varint field 2, fixed64 field 3, fixed32 field 4, string field 5,
+        # around a texts (field 1) entry.
+        fp.write(b"\x10\x96\x01")
+        fp.write(b"\x19" + bytes(8))
+        fp.write(b"\x0a\x02ab")
+        fp.write(b"\x25" + bytes(4))
+        fp.write(b"\x2a\x03xyz")
+
+    assert Epub.from_protobuf(filepath).texts == ["ab"]
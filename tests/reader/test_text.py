@@ -0,0 +1,61 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from epublib.reader import (
+    PARALLEL_THRESHOLD,
+    convert_documents,
+    html_to_text,
+    strip_html_tags,
+)
+
+
+def test_convert_documents_executor():
+    documents = [
+        b"<html><body><p>Chapter %d</p></body></html>" % index
+        for index in range(PARALLEL_THRESHOLD)
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        texts = convert_documents(documents, executor=executor)
+
+    assert texts == convert_documents(documents)
+    assert texts[-1] == "Chapter %d\n" % (PARALLEL_THRESHOLD - 1)
+
+
+def test_block_boundaries():
+    document = (
+        b"<html><body><h1>Title</h1><p>First.</p><p>Second<br/>line.</p></body></html>"
+    )
+
+    assert html_to_text(document) == "Title\nFirst.\nSecond\nline.\n"
+    assert strip_html_tags(document) == html_to_text(document)
+
+
+def test_quoted_attributes():
+    document = (
+        b"<html><body>"
+        b"<p title='a>b'>t</p><p class=\"c>d\">u</p>"
+        b"<script data-x='e>f'>v</script>"
+        b"</body></html>"
+    )
+
+    assert strip_html_tags(document) == "t\nu\n"
+    assert html_to_text(document) == "t\nu\n"
+
+
+def test_self_closing_script():
+    document = (
+        b"<html><body>"
+        b'<script type="text/javascript" src="a.js"/>'
+        b"<p>Important text.</p><p>More.</p>"
+        b"<script>var x=1;</script>"
+        b"</body></html>"
+    )
+
+    assert strip_html_tags(document) == "Important text.\nMore.\n"
+    assert html_to_text(document) == "Important text.\nMore.\n"
+
+
+@pytest.mark.parametrize("document", [b"", b"\n", b"  \n  "])
+def test_blank_document(document: bytes):
+    assert html_to_text(document) == ""
+    assert strip_html_tags(document) == ""